@@ -0,0 +1,85 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Iterable
+
+
+class CacheBackend(ABC):
+    # async so that a shared backend (Redis, memcached...) can be plugged in for several workers
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: Any, ttl: float, tags: Iterable[str] = ()
+    ) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def invalidate_tag(self, tag: str) -> None:
+        """Deletes every key that was set with this tag."""
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class InMemoryCache(CacheBackend):
+    # TTL + LRU: entries expire after ttl seconds and the least recently used goes first when full
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._tags: dict[str, set[str]] = {}  # tag -> keys, for invalidate_tag
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():  # expired entries are removed lazily
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)  # most recently used
+        return value
+
+    async def set(
+        self, key: str, value: Any, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        if self.maxsize <= 0 or ttl <= 0:  # maxsize 0 disables the cache
+            return
+        if key in self._entries:
+            self._remove(key)
+        tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))  # least recently used
+
+    async def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    async def invalidate_tag(self, tag: str) -> None:
+        for key in list(self._tags.get(tag, ())):
+            self._remove(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
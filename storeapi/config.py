@@ -16,8 +16,25 @@ class BaseConfig(BaseSettings):
 class GlobalConfig(BaseConfig):
     DATABASE_URL: Optional[str] = None  # if not found in .env file
     DB_FORCE_ROLL_BACK: bool = False  # to clear the db after each test
+    DB_MIN_POOL_SIZE: int = 1  # pooled backends only (postgresql://, mysql://)
+    DB_MAX_POOL_SIZE: int = 10
+    DB_ACQUIRE_TIMEOUT: float = 5.0  # seconds waiting for a free connection
+    DB_STATEMENT_TIMEOUT: Optional[float] = 30.0  # seconds, enforced by postgres
+    SQLITE_TUNING: bool = False  # WAL, pragmas and a single writer connection
+    SQLITE_READ_CONNECTIONS: int = 4  # readers next to the writer, WAL lets them run at once
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes
+    SQLITE_CACHE_SIZE: int = -64_000  # negative is KiB, so 64MB per connection
+    SQLITE_BUSY_TIMEOUT: int = 5_000  # ms
     JWT_SECRET_KEY: Optional[str] = None
     JWT_ALGORITHM: Optional[str] = None
+    POSTS_PAGE_SIZE: int = 50  # default page of GET /post when no limit is given
+    POSTS_MAX_PAGE_SIZE: int = 500  # the client can't ask for more than this
+    POSTS_STREAM_BATCH_SIZE: int = 500  # rows pulled per query in NDJSON mode
+    BCRYPT_ROUNDS: int = 12  # cost factor, every +1 doubles the hashing time
+    HASH_POOL_SIZE: int = 4  # threads doing bcrypt outside the event loop
+    HASH_QUEUE_LIMIT: int = 64  # waiting hashes before answering 503
+    USER_CACHE_SIZE: int = 10_000  # authenticated users kept in memory, 0 disables it
+    USER_CACHE_TTL: int = 60  # seconds, never longer than the token itself
 
 
 class DevConfig(GlobalConfig):
@@ -28,6 +45,7 @@ class DevConfig(GlobalConfig):
 class TestConfig(GlobalConfig):
     DATABASE_URL: str = "sqlite:///test.db"  # not username and password, automatically generated by the code
     DB_FORCE_ROLL_BACK: bool = True
+    BCRYPT_ROUNDS: int = 4  # the minimum, tests don't need slow hashes
 
     model_config = SettingsConfigDict(env_prefix="TEST_")
 
@@ -1,7 +1,8 @@
-import databases
 import sqlalchemy
 
 from storeapi.config import config  # from module import variable config, info from .env
+from storeapi.db_pool import PooledDatabase, pool_options
+from storeapi.sqlite_tuning import TunedSQLiteBackend, sqlite_pragmas
 
 metadata = sqlalchemy.MetaData()
 
@@ -30,14 +31,46 @@ user_table = sqlalchemy.Table(
     sqlalchemy.Column("password", sqlalchemy.String),
 )
 
+
+def sync_database_url(url: str) -> str:
+    # create_all needs a synchronous driver, postgresql+asyncpg:// -> postgresql://
+    sync_url = sqlalchemy.engine.make_url(url)
+    if sync_url.drivername.endswith(("+asyncpg", "+aiopg")):
+        sync_url = sync_url.set(drivername=sync_url.drivername.split("+")[0])
+    return sync_url.render_as_string(hide_password=False)
+
+
+# for sqlite, by defaults connects 1 thread but FastAPI  can use more, useful for backend tasks
+connect_args = (
+    {"check_same_thread": False} if config.DATABASE_URL.startswith("sqlite") else {}
+)
 engine = sqlalchemy.create_engine(
-    config.DATABASE_URL,
-    connect_args={
-        "check_same_thread": False
-    },  # for sqlite, by defaults connects 1 thread but FastAPI  can use more, useful for backend tasks
+    sync_database_url(config.DATABASE_URL), connect_args=connect_args
 )
 
 metadata.create_all(engine)
-database = databases.Database(
-    config.DATABASE_URL, force_rollback=config.DB_FORCE_ROLL_BACK
+
+tuned_sqlite_backend = None
+if config.SQLITE_TUNING and config.DATABASE_URL.startswith("sqlite"):
+    tuned_sqlite_backend = TunedSQLiteBackend(
+        config.DATABASE_URL,
+        read_connections=config.SQLITE_READ_CONNECTIONS,
+        pragmas=sqlite_pragmas(
+            mmap_size=config.SQLITE_MMAP_SIZE,
+            cache_size=config.SQLITE_CACHE_SIZE,
+            busy_timeout=config.SQLITE_BUSY_TIMEOUT,
+        ),
+    )
+
+database = PooledDatabase(
+    config.DATABASE_URL,
+    force_rollback=config.DB_FORCE_ROLL_BACK,
+    acquire_timeout=config.DB_ACQUIRE_TIMEOUT,
+    backend=tuned_sqlite_backend,
+    **pool_options(
+        config.DATABASE_URL,
+        min_size=config.DB_MIN_POOL_SIZE,
+        max_size=config.DB_MAX_POOL_SIZE,
+        statement_timeout=config.DB_STATEMENT_TIMEOUT,
+    ),
 )
@@ -0,0 +1,130 @@
+import asyncio
+import time
+import typing
+from dataclasses import dataclass
+
+import databases
+from databases.interfaces import ConnectionBackend, DatabaseBackend
+from sqlalchemy.sql import ClauseElement
+
+
+@dataclass
+class PoolStats:
+    in_use: int = 0  # connections held by a request right now
+    waiting: int = 0  # requests waiting for a connection
+    acquired: int = 0
+    timeouts: int = 0  # acquires that took longer than the acquire timeout
+    acquire_seconds: float = 0.0  # total, divide by acquired for the average
+    max_acquire_seconds: float = 0.0
+
+
+def pool_options(
+    url: str,
+    *,
+    min_size: int,
+    max_size: int,
+    statement_timeout: float | None,
+) -> dict:
+    # databases passes these keyword arguments to the driver's create_pool
+    dialect = databases.DatabaseURL(url).dialect
+    if dialect == "sqlite":  # aiosqlite connects once per request, there is no pool
+        return {}
+
+    options: dict[str, typing.Any] = {"min_size": min_size, "max_size": max_size}
+    if statement_timeout and dialect in ("postgresql", "postgres"):
+        milliseconds = str(int(statement_timeout * 1000))
+        if databases.DatabaseURL(url).driver == "aiopg":
+            options["options"] = f"-c statement_timeout={milliseconds}"
+        else:  # asyncpg, the default driver for postgresql://
+            options["server_settings"] = {"statement_timeout": milliseconds}
+    return options
+
+
+class TrackedConnection(ConnectionBackend):
+    # wraps the driver connection to time how long it takes to get one from the pool
+    def __init__(self, connection: ConnectionBackend, database: "PooledDatabase"):
+        self._inner = connection
+        self._database = database
+
+    async def acquire(self) -> None:
+        stats = self._database.pool_stats
+        timeout = self._database.acquire_timeout
+        stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._inner.acquire(), timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise
+        finally:
+            stats.waiting -= 1
+
+        elapsed = time.perf_counter() - started
+        stats.acquired += 1
+        stats.in_use += 1
+        stats.acquire_seconds += elapsed
+        stats.max_acquire_seconds = max(stats.max_acquire_seconds, elapsed)
+
+    async def release(self) -> None:
+        try:
+            await self._inner.release()
+        finally:
+            self._database.pool_stats.in_use -= 1
+
+    async def fetch_all(self, query: ClauseElement) -> typing.List[typing.Any]:
+        return await self._inner.fetch_all(query)
+
+    async def fetch_one(self, query: ClauseElement) -> typing.Any:
+        return await self._inner.fetch_one(query)
+
+    async def fetch_val(self, query: ClauseElement, column: typing.Any = 0):
+        return await self._inner.fetch_val(query, column)
+
+    async def execute(self, query: ClauseElement) -> typing.Any:
+        return await self._inner.execute(query)
+
+    async def execute_many(self, queries: typing.List[ClauseElement]) -> None:
+        await self._inner.execute_many(queries)
+
+    async def iterate(self, query: ClauseElement):
+        async for record in self._inner.iterate(query):
+            yield record
+
+    def transaction(self):
+        return self._inner.transaction()
+
+    @property
+    def raw_connection(self) -> typing.Any:
+        return self._inner.raw_connection
+
+
+class TrackedBackend(DatabaseBackend):
+    def __init__(self, backend: DatabaseBackend, database: "PooledDatabase"):
+        self._inner = backend
+        self._database = database
+
+    async def connect(self) -> None:
+        await self._inner.connect()
+
+    async def disconnect(self) -> None:
+        await self._inner.disconnect()
+
+    def connection(self) -> ConnectionBackend:
+        return TrackedConnection(self._inner.connection(), self._database)
+
+
+class PooledDatabase(databases.Database):
+    """databases.Database that keeps pool statistics and times out slow acquires."""
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        acquire_timeout: float | None = None,
+        backend: DatabaseBackend | None = None,  # instead of the one for the URL scheme
+        **options: typing.Any,
+    ):
+        super().__init__(url, **options)
+        self.acquire_timeout = acquire_timeout
+        self.pool_stats = PoolStats()
+        self._backend = TrackedBackend(backend or self._backend, self)
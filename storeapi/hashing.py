@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from fastapi import HTTPException, status
+
+from storeapi.config import config
+
+logger = logging.getLogger(__name__)  # storeapi.hashing
+
+T = TypeVar("T")
+
+
+@dataclass
+class HashingStats:
+    completed: int = 0
+    rejected: int = 0  # requests answered with 503 because the queue was full
+    queue_wait_seconds: float = 0.0  # total time jobs waited for a free thread
+    hash_seconds: float = 0.0  # total time spent inside bcrypt
+
+
+class HashingPool:
+    # bcrypt releases the GIL, so a few threads are enough to keep it off the event loop
+    def __init__(self, max_workers: int, queue_limit: int):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.stats = HashingStats()
+        self.in_flight = 0  # running + waiting jobs
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:  # created on first use, and again after shutdown
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if self.in_flight >= self.max_workers + self.queue_limit:
+            self.stats.rejected += 1
+            logger.warning("Hashing pool saturated, rejecting request")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[T, float, float]:  # runs in the worker thread
+            started = time.perf_counter()
+            result = func(*args)
+            return result, started - submitted, time.perf_counter() - started
+
+        self.in_flight += 1
+        try:
+            result, waited, took = await asyncio.get_running_loop().run_in_executor(
+                self.executor, timed
+            )
+        finally:
+            self.in_flight -= 1
+
+        self.stats.completed += 1
+        self.stats.queue_wait_seconds += waited
+        self.stats.hash_seconds += took
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool(
+    max_workers=config.HASH_POOL_SIZE, queue_limit=config.HASH_QUEUE_LIMIT
+)
@@ -6,7 +6,9 @@ from fastapi import FastAPI, HTTPException
 from fastapi.exception_handlers import http_exception_handler
 
 from storeapi.database import database
+from storeapi.hashing import hashing_pool
 from storeapi.logging_conf import configure_logging
+from storeapi.routers.health import router as health_router
 from storeapi.routers.post import router as post_router
 from storeapi.routers.user import router as user_router
 
@@ -20,6 +22,7 @@ async def lifespan(app: FastAPI):
     await database.connect()  # FastAPI will start it up
     yield  # FastAPI  will yield
     await database.disconnect()  # FastAPI will shut it down
+    hashing_pool.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -27,6 +30,7 @@ app.add_middleware(CorrelationIdMiddleware)
 
 app.include_router(post_router)
 app.include_router(user_router)
+app.include_router(health_router)
 
 
 @app.exception_handler(HTTPException)
@@ -0,0 +1,18 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter
+
+from storeapi.config import config
+from storeapi.database import database
+
+router = APIRouter()
+
+
+@router.get("/health/db")
+async def database_pool_stats():
+    return {
+        "backend": database.url.dialect,
+        "min_size": config.DB_MIN_POOL_SIZE,
+        "max_size": config.DB_MAX_POOL_SIZE,
+        **asdict(database.pool_stats),
+    }
@@ -1,8 +1,12 @@
+import base64
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+import sqlalchemy
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
+from storeapi.config import config
 from storeapi.database import comment_table, database, post_table
 from storeapi.models.post import (
     Comment,
@@ -49,17 +53,72 @@ async def create_post(
     return {**data, "id": last_record_id}
 
 
+def encode_cursor(post_id: int) -> str:
+    # opaque for the client, it only has to send it back in ?after=
+    return base64.urlsafe_b64encode(str(post_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except ValueError as e:  # binascii.Error and UnicodeDecodeError are ValueErrors
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def posts_page_query(after_id: int | None, limit: int):
+    # keyset pagination: WHERE id > last seen id, it uses the primary key index
+    # so the cost doesn't grow with the page number like OFFSET does
+    query = post_table.select().order_by(post_table.c.id).limit(limit)
+    if after_id is not None:
+        query = query.where(post_table.c.id > after_id)
+    return query
+
+
+async def stream_posts(after_id: int | None):
+    batch_size = config.POSTS_STREAM_BATCH_SIZE
+    while True:
+        rows = await database.fetch_all(posts_page_query(after_id, batch_size))
+        for row in rows:
+            yield UserPost.model_validate(row).model_dump_json() + "\n"
+        if len(rows) < batch_size:
+            break
+        after_id = rows[-1].id  # only one batch is kept in memory
+
+
 @router.get(
     "/post", response_model=list[UserPost]
 )  # the same endpoint can be requested with different petitions, like get or post
-async def get_all_posts():
+async def get_all_posts(
+    request: Request,
+    response: Response,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    after: str | None = None,  # cursor from the Link header of the previous page
+    stream: bool = False,  # NDJSON with every post after the cursor
+):
     logger.info("Getting all posts")
 
-    query = post_table.select()
+    after_id = decode_cursor(after) if after else None
+
+    if stream:
+        return StreamingResponse(
+            stream_posts(after_id), media_type="application/x-ndjson"
+        )
+
+    limit = min(limit or config.POSTS_PAGE_SIZE, config.POSTS_MAX_PAGE_SIZE)
+    # one more row than asked to know if there is a next page
+    query = posts_page_query(after_id, limit + 1)
 
     logger.debug(query)
 
-    return await database.fetch_all(query)
+    posts = await database.fetch_all(query)
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_url = request.url.include_query_params(
+            limit=limit, after=encode_cursor(posts[-1].id)
+        )
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return posts
 
 
 @router.post("/comment", response_model=Comment, status_code=201)
@@ -93,11 +152,68 @@ async def get_comments_on_post(post_id: int):
     return await database.fetch_all(query)
 
 
+async def load_posts_with_comments(post_ids: list[int]) -> list[dict]:
+    # one LEFT JOIN for all the posts and their comments instead of 1 + N round-trips,
+    # the rows come ordered so they are grouped in a single pass
+    query = (
+        sqlalchemy.select(
+            post_table.c.id,
+            post_table.c.body,
+            post_table.c.user_id,
+            comment_table.c.id.label("comment_id"),
+            comment_table.c.body.label("comment_body"),
+            comment_table.c.user_id.label("comment_user_id"),
+        )
+        .select_from(
+            post_table.outerjoin(
+                comment_table, comment_table.c.post_id == post_table.c.id
+            )
+        )
+        .where(post_table.c.id.in_(post_ids))
+        .order_by(post_table.c.id, comment_table.c.id)
+    )
+    logger.debug(query)
+
+    posts: dict[int, dict] = {}
+    for row in await database.fetch_all(query):
+        post = posts.get(row.id)
+        if post is None:
+            post = posts[row.id] = {
+                "post": {"id": row.id, "body": row.body, "user_id": row.user_id},
+                "comments": [],
+            }
+        if row.comment_id is not None:  # posts without comments come with NULLs
+            post["comments"].append(
+                {
+                    "id": row.comment_id,
+                    "body": row.comment_body,
+                    "post_id": row.id,
+                    "user_id": row.comment_user_id,
+                }
+            )
+    return [posts[post_id] for post_id in post_ids if post_id in posts]
+
+
+# before /post/{post_id}, otherwise "bulk" is parsed as a post id
+@router.get("/post/bulk", response_model=list[UserPostWithComments])
+async def get_posts_with_comments(
+    ids: Annotated[list[int], Query(min_length=1)],
+):
+    logger.info("Getting posts with comments in bulk")
+    post_ids = list(dict.fromkeys(ids))  # without duplicates, in the requested order
+    if len(post_ids) > config.POSTS_MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No more than {config.POSTS_MAX_PAGE_SIZE} posts per request",
+        )
+    return await load_posts_with_comments(post_ids)
+
+
 @router.get("/post/{post_id}", response_model=UserPostWithComments)
 async def get_post_with_comments(post_id: int):
     logger.info("Getting posts with comments")
-    post = await find_post(post_id)
-    if not post:
+    posts = await load_posts_with_comments([post_id])
+    if not posts:
         # logger.error(f"Post with post id {post_id} not found") # not needed if we use the decorator for the exception handler
         raise HTTPException(status_code=404, detail="Post not found")
-    return {"post": post, "comments": await get_comments_on_post(post_id)}
+    return posts[0]
@@ -9,8 +9,9 @@ from storeapi.models.user import UserIn
 from storeapi.security import (
     authenticate_user,
     create_access_token,
-    get_password_hash,
+    get_password_hash_async,
     get_user,
+    invalidate_cached_user,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ async def register(user: UserIn):
             detail="A user with that email already exists",
         )
     # we'll hash the password later/now
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash_async(user.password)
     query = user_table.insert().values(
         email=user.email, password=hashed_password
     )  # before it was password = user.password
@@ -35,6 +36,7 @@ async def register(user: UserIn):
     logger.debug(query)
 
     await database.execute(query)
+    await invalidate_cached_user(user.email)
     return {"detail": "User created"}
 
 
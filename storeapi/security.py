@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
@@ -7,8 +8,11 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
 
+from storeapi.cache import CacheBackend, InMemoryCache
 from storeapi.config import config
 from storeapi.database import database, user_table
+from storeapi.hashing import hashing_pool
+from storeapi.models.user import User
 
 logger = logging.getLogger(__name__)  # storeapi.security
 
@@ -18,7 +22,12 @@ oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="token"
 )  # in user router, the token endpoint, where the client sends the email and password and gets back the token
 
-pwd_context = CryptContext(schemes=["bcrypt"])
+pwd_context = CryptContext(
+    schemes=["bcrypt"], bcrypt__rounds=config.BCRYPT_ROUNDS
+)  # rounds is the cost factor, lower in tests
+
+# verified token (sub + exp) -> user, so protected routes don't query users every time
+user_cache: CacheBackend = InMemoryCache(maxsize=config.USER_CACHE_SIZE)
 
 credentials_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -61,6 +70,26 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     # verify uses info from the hashed password to hash in the same way the plain password
 
 
+# the async versions are the ones to use in the handlers, bcrypt would block the event loop
+async def get_password_hash_async(password: str) -> str:
+    return await hashing_pool.run(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_pool.run(verify_password, plain_password, hashed_password)
+
+
+def set_user_cache(backend: CacheBackend) -> None:
+    # for a shared backend, so all the workers see the same entries and invalidations
+    global user_cache
+    user_cache = backend
+
+
+async def invalidate_cached_user(email: str) -> None:
+    # to be called whenever a user changes, it drops the entries of all their tokens
+    await user_cache.invalidate_tag(f"user:{email}")
+
+
 async def get_user(email: str):
     logger.debug("Fetching user from the database", extra={"email": email})
     query = user_table.select().where(user_table.c.email == email)
@@ -75,7 +104,7 @@ async def authenticate_user(email: str, password: str):
     if not user:  # user doesn't exist
         # pass
         raise credentials_exception
-    if not verify_password(
+    if not await verify_password_async(
         password, user.password
     ):  # the plain password doesn't match the hashed password
         # pass
@@ -101,7 +130,21 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
     except JWTError as e:
         raise credentials_exception from e
 
+    expire = payload.get("exp")
+    cache_key = f"user:{email}:{expire}"
+    cached_user = await user_cache.get(cache_key)
+    if cached_user is not None:
+        return User(**cached_user)
+
     user = await get_user(email=email)
     if user is None:
         raise credentials_exception
-    return user
+
+    current_user = User(id=user.id, email=user.email)  # without the password hash
+    ttl: float = config.USER_CACHE_TTL
+    if expire is not None:
+        ttl = min(ttl, expire - time.time())
+    await user_cache.set(
+        cache_key, current_user.model_dump(), ttl, tags=[f"user:{email}"]
+    )
+    return current_user
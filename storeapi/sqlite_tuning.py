@@ -0,0 +1,161 @@
+import asyncio
+import typing
+
+import aiosqlite
+from databases.backends.sqlite import SQLiteBackend, SQLiteConnection, SQLiteTransaction
+from databases.interfaces import ConnectionBackend, DatabaseBackend, TransactionBackend
+from sqlalchemy.sql import ClauseElement
+
+
+def sqlite_pragmas(
+    *, mmap_size: int, cache_size: int, busy_timeout: int
+) -> dict[str, typing.Any]:
+    return {
+        "synchronous": "NORMAL",  # with WAL it only fsyncs at checkpoints, still safe
+        "mmap_size": mmap_size,  # bytes read through the OS page cache instead of read()
+        "cache_size": cache_size,  # negative is KiB, positive is pages
+        "busy_timeout": busy_timeout,  # ms waiting for a lock instead of "database is locked"
+        "temp_store": "MEMORY",
+    }
+
+
+class TunedSQLiteBackend(DatabaseBackend):
+    """SQLite in WAL mode with one writer connection and a pool of readers.
+
+    SQLite allows a single writer at a time, so all writes (and transactions) are
+    serialized through one connection with an asyncio lock instead of fighting for
+    the file lock. Readers in WAL mode don't block the writer nor each other.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        read_connections: int,
+        pragmas: dict[str, typing.Any],
+    ):
+        self._sqlite = SQLiteBackend(url)  # for the dialect and the connect arguments
+        self._dialect = self._sqlite._dialect
+        self._pragmas = pragmas
+        in_memory = self._sqlite._pool._database in ("", ":memory:")
+        # every connection to :memory: is a different database, only the writer then
+        self._read_connections = 0 if in_memory else read_connections
+
+        self.writer_lock = asyncio.Lock()
+        self._writer: SQLiteConnection | None = None
+        self._readers: asyncio.Queue[SQLiteConnection] = asyncio.Queue()
+        self._all_readers: list[SQLiteConnection] = []
+
+    async def _open(self, *, read_only: bool) -> SQLiteConnection:
+        raw = await self._sqlite._pool.acquire()
+        for name, value in self._pragmas.items():
+            await raw.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            await raw.execute("PRAGMA query_only=ON")
+        else:
+            await raw.execute("PRAGMA journal_mode=WAL")  # persistent, stored in the file
+        connection = SQLiteConnection(self._sqlite._pool, self._dialect)
+        connection._connection = raw
+        return connection
+
+    async def connect(self) -> None:
+        self.writer_lock = asyncio.Lock()  # bound to the running event loop
+        self._readers = asyncio.Queue()
+        self._writer = await self._open(read_only=False)
+        for _ in range(self._read_connections):
+            reader = await self._open(read_only=True)
+            self._all_readers.append(reader)
+            self._readers.put_nowait(reader)
+
+    async def disconnect(self) -> None:
+        for connection in [self._writer, *self._all_readers]:
+            if connection is not None:
+                await connection.release()
+        self._writer = None
+        self._all_readers = []
+
+    def connection(self) -> "TunedSQLiteConnection":
+        return TunedSQLiteConnection(self)
+
+    @property
+    def writer(self) -> SQLiteConnection:
+        assert self._writer is not None, "DatabaseBackend is not running"
+        return self._writer
+
+    async def read(self, method: str, *args: typing.Any) -> typing.Any:
+        if not self._all_readers:
+            async with self.writer_lock:
+                return await getattr(self.writer, method)(*args)
+        reader = await self._readers.get()
+        try:
+            return await getattr(reader, method)(*args)
+        finally:
+            self._readers.put_nowait(reader)
+
+
+class WriterTransaction(SQLiteTransaction):
+    def __init__(self, connection: "TunedSQLiteConnection"):
+        super().__init__(connection.backend.writer)
+        self._tuned_connection = connection
+
+    async def start(
+        self, is_root: bool, extra_options: dict[typing.Any, typing.Any]
+    ) -> None:
+        # the writer is kept until the request releases its connection
+        await self._tuned_connection.hold_writer()
+        await super().start(is_root, extra_options)
+
+
+class TunedSQLiteConnection(ConnectionBackend):
+    # SELECTs go to a reader, anything else (and everything inside a transaction) to the writer
+    def __init__(self, backend: TunedSQLiteBackend):
+        self.backend = backend
+        self._holds_writer = False
+
+    async def hold_writer(self) -> None:
+        if not self._holds_writer:
+            await self.backend.writer_lock.acquire()
+            self._holds_writer = True
+
+    async def acquire(self) -> None:
+        pass  # connections are taken per query, see _run
+
+    async def release(self) -> None:
+        if self._holds_writer:
+            self._holds_writer = False
+            self.backend.writer_lock.release()
+
+    async def _run(self, method: str, query: ClauseElement, *args: typing.Any):
+        if not self._holds_writer and getattr(query, "is_select", False):
+            return await self.backend.read(method, query, *args)
+        await self.hold_writer()
+        return await getattr(self.backend.writer, method)(query, *args)
+
+    async def fetch_all(self, query: ClauseElement) -> list[typing.Any]:
+        return await self._run("fetch_all", query)
+
+    async def fetch_one(self, query: ClauseElement) -> typing.Any:
+        return await self._run("fetch_one", query)
+
+    async def fetch_val(self, query: ClauseElement, column: typing.Any = 0):
+        return await self._run("fetch_val", query, column)
+
+    async def execute(self, query: ClauseElement) -> typing.Any:
+        await self.hold_writer()
+        return await self.backend.writer.execute(query)
+
+    async def execute_many(self, queries: list[ClauseElement]) -> None:
+        await self.hold_writer()
+        await self.backend.writer.execute_many(queries)
+
+    async def iterate(self, query: ClauseElement):
+        await self.hold_writer()  # databases always iterates inside a transaction
+        async for record in self.backend.writer.iterate(query):
+            yield record
+
+    def transaction(self) -> TransactionBackend:
+        return WriterTransaction(self)
+
+    @property
+    def raw_connection(self) -> aiosqlite.Connection:
+        return self.backend.writer.raw_connection
@@ -12,6 +12,7 @@ os.environ["ENV_STATE"] = "test"
 
 from storeapi.database import database, user_table  # noqa E402
 from storeapi.main import app  # noqa E402
+from storeapi import security  # noqa E402
 # we don't want the import to go upper
 # app --> database.py --> config.py --> environment
 
@@ -38,6 +39,7 @@ async def db() -> AsyncGenerator:
     # comment_table.clear()
     yield database  # test function
     await database.disconnect()  # undo whatever the test did, roll_back
+    await security.user_cache.clear()  # the users it cached were rolled back too
 
 
 @pytest.fixture()
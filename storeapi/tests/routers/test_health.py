@@ -0,0 +1,10 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.anyio
+async def test_database_pool_stats(async_client: AsyncClient):
+    response = await async_client.get("/health/db")
+    assert response.status_code == 200
+    assert response.json()["backend"] == "sqlite"
+    assert {"in_use", "waiting", "acquired", "timeouts"} <= response.json().keys()
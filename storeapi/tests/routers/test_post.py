@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 
@@ -103,6 +105,42 @@ async def test_get_all_posts(
     assert response.json() == [created_post]
 
 
+@pytest.mark.anyio
+async def test_get_all_posts_paginated(async_client: AsyncClient, logged_in_token: str):
+    posts = [
+        await create_post(f"Post {i}", async_client, logged_in_token) for i in range(3)
+    ]
+
+    response = await async_client.get("/post", params={"limit": 2})
+    assert response.status_code == 200
+    assert response.json() == posts[:2]
+    assert 'rel="next"' in response.headers["link"]
+
+    next_url = response.links["next"]["url"]
+    response = await async_client.get(next_url)
+    assert response.status_code == 200
+    assert response.json() == posts[2:]
+    assert "link" not in response.headers  # last page
+
+
+@pytest.mark.anyio
+async def test_get_all_posts_invalid_cursor(async_client: AsyncClient):
+    response = await async_client.get("/post", params={"after": "not a cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_get_all_posts_stream(async_client: AsyncClient, logged_in_token: str):
+    posts = [
+        await create_post(f"Post {i}", async_client, logged_in_token) for i in range(3)
+    ]
+
+    response = await async_client.get("/post", params={"stream": True})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == posts
+
+
 @pytest.mark.anyio
 async def test_create_comment(
     async_client: AsyncClient,
@@ -162,3 +200,23 @@ async def test_get_missing_post_with_comments(
 ):
     response = await async_client.get("/post/2")
     assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_get_posts_with_comments_bulk(
+    async_client: AsyncClient,
+    created_post: dict,
+    created_comment: dict,
+    logged_in_token: str,
+):
+    other_post = await create_post("Other Post", async_client, logged_in_token)
+
+    response = await async_client.get(
+        "/post/bulk", params={"ids": [other_post["id"], created_post["id"], 99]}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"post": other_post, "comments": []},
+        {"post": created_post, "comments": [created_comment]},
+    ]
@@ -0,0 +1,51 @@
+import pytest
+
+from storeapi.cache import InMemoryCache
+
+
+@pytest.mark.anyio
+async def test_cache_set_and_get():
+    cache = InMemoryCache(maxsize=10)
+    await cache.set("a", 1, ttl=60)
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is None
+
+
+@pytest.mark.anyio
+async def test_cache_expired_entry(mocker):
+    cache = InMemoryCache(maxsize=10)
+    await cache.set("a", 1, ttl=60)
+    mocker.patch("storeapi.cache.time.monotonic", return_value=10**12)
+    assert await cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_cache_evicts_least_recently_used():
+    cache = InMemoryCache(maxsize=2)
+    await cache.set("a", 1, ttl=60)
+    await cache.set("b", 2, ttl=60)
+    await cache.get("a")  # now b is the least recently used
+    await cache.set("c", 3, ttl=60)
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+
+
+@pytest.mark.anyio
+async def test_cache_invalidate_tag():
+    cache = InMemoryCache(maxsize=10)
+    await cache.set("a", 1, ttl=60, tags=["x"])
+    await cache.set("b", 2, ttl=60, tags=["x", "y"])
+    await cache.set("c", 3, ttl=60, tags=["y"])
+    await cache.invalidate_tag("x")
+    assert await cache.get("a") is None
+    assert await cache.get("b") is None
+    assert await cache.get("c") == 3
+
+
+@pytest.mark.anyio
+async def test_cache_disabled():
+    cache = InMemoryCache(maxsize=0)
+    await cache.set("a", 1, ttl=60)
+    assert await cache.get("a") is None
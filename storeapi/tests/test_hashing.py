@@ -0,0 +1,40 @@
+import pytest
+from fastapi import HTTPException
+
+from storeapi import security
+from storeapi.hashing import HashingPool
+
+
+@pytest.mark.anyio
+async def test_hashing_pool_runs_function():
+    pool = HashingPool(max_workers=1, queue_limit=1)
+    assert await pool.run(pow, 2, 3) == 8
+    assert pool.stats.completed == 1
+    assert pool.in_flight == 0
+    pool.shutdown()
+
+
+@pytest.mark.anyio
+async def test_hashing_pool_saturated():
+    pool = HashingPool(max_workers=1, queue_limit=1)
+    pool.in_flight = 2  # one running and one waiting
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.run(pow, 2, 3)
+    assert exc_info.value.status_code == 503
+    assert pool.stats.rejected == 1
+
+
+@pytest.mark.anyio
+async def test_password_hashes_async():
+    hashed = await security.get_password_hash_async("password")
+    assert await security.verify_password_async("password", hashed)
+    assert not await security.verify_password_async("wrong password", hashed)
+
+
+@pytest.mark.anyio
+async def test_register_when_hashing_pool_saturated(async_client, mocker):
+    mocker.patch.object(security.hashing_pool, "in_flight", 10_000)
+    response = await async_client.post(
+        "/register", json={"email": "test@example.net", "password": "1234"}
+    )
+    assert response.status_code == 503
@@ -78,3 +78,26 @@ async def test_current_user(registered_user: dict):
 async def test_get_current_user_invalid_token():
     with pytest.raises(security.HTTPException):
         await security.get_current_user("invalid token")
+
+
+@pytest.mark.anyio
+async def test_current_user_is_cached(registered_user: dict, mocker):
+    token = security.create_access_token(registered_user["email"])
+    await security.get_current_user(token)
+
+    get_user = mocker.patch("storeapi.security.get_user")
+    user = await security.get_current_user(token)
+    assert user.email == registered_user["email"]
+    assert user.id == registered_user["id"]
+    get_user.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_current_user_cache_invalidated(registered_user: dict, mocker):
+    token = security.create_access_token(registered_user["email"])
+    await security.get_current_user(token)
+    await security.invalidate_cached_user(registered_user["email"])
+
+    get_user = mocker.patch("storeapi.security.get_user", wraps=security.get_user)
+    await security.get_current_user(token)
+    get_user.assert_called_once()
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+import sqlalchemy
+
+from storeapi.database import metadata, post_table, user_table
+from storeapi.db_pool import PooledDatabase
+from storeapi.sqlite_tuning import TunedSQLiteBackend, sqlite_pragmas
+
+
+@pytest.fixture()
+async def tuned_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tuned.db'}"
+    metadata.create_all(sqlalchemy.create_engine(url))
+    backend = TunedSQLiteBackend(
+        url,
+        read_connections=2,
+        pragmas=sqlite_pragmas(mmap_size=0, cache_size=-2000, busy_timeout=1000),
+    )
+    tuned_database = PooledDatabase(url, backend=backend)
+    await tuned_database.connect()
+    await tuned_database.execute(
+        user_table.insert().values(email="test@example.net", password="x")
+    )
+    yield tuned_database
+    await tuned_database.disconnect()
+
+
+@pytest.mark.anyio
+async def test_tuned_sqlite_uses_wal(tuned_database: PooledDatabase):
+    assert await tuned_database.fetch_val("PRAGMA journal_mode") == "wal"
+
+
+@pytest.mark.anyio
+async def test_tuned_sqlite_concurrent_writes(tuned_database: PooledDatabase):
+    async def insert(i: int):
+        return await tuned_database.execute(
+            post_table.insert().values(body=f"Post {i}", user_id=1)
+        )
+
+    ids = await asyncio.gather(*(insert(i) for i in range(50)))
+    assert sorted(ids) == list(range(1, 51))
+
+    query = sqlalchemy.select(sqlalchemy.func.count()).select_from(post_table)
+    assert await tuned_database.fetch_val(query) == 50
+
+
+@pytest.mark.anyio
+async def test_tuned_sqlite_transaction_rollback(tuned_database: PooledDatabase):
+    with pytest.raises(RuntimeError):
+        async with tuned_database.transaction():
+            await tuned_database.execute(
+                post_table.insert().values(body="Rolled back", user_id=1)
+            )
+            # reads inside the transaction see its own writes
+            assert len(await tuned_database.fetch_all(post_table.select())) == 1
+            raise RuntimeError
+
+    assert await tuned_database.fetch_all(post_table.select()) == []
+
+
+@pytest.mark.anyio
+async def test_tuned_sqlite_readers_are_read_only(tuned_database: PooledDatabase):
+    reader = await tuned_database._backend._inner._readers.get()
+    with pytest.raises(Exception, match="readonly"):
+        await reader.execute(post_table.insert().values(body="Nope", user_id=1))